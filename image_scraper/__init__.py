@@ -1,5 +1,5 @@
-__version__ = "0.1.0"
-__date__ = "2025-10-17"
+__version__ = "0.2.0"
+__date__ = "2026-10-19"
 __author__ = "Krish Kapoor"
 __email__ = "krishk122703@gmail.com"
 __status__ = "Development"
@@ -11,7 +11,8 @@ from .scraper import (
     handle_cookies,
     save_cookies,
     load_cookies,
-    driver_setup
+    driver_setup,
+    OutputWriter
 )
 
 __all__ = [
@@ -22,5 +23,6 @@ __all__ = [
     "save_cookies",
     "load_cookies",
     "driver_setup",
+    "OutputWriter",
     "__version__"
 ]
@@ -6,6 +6,21 @@ HEADLESS = False
 SELECTOR_VERSION = "2025-10-17"
 DELAY = 1
 
+# IMAGE CAPTURE:
+CAPTURE_INLINE_IMAGES = True #decode base64 data: URIs instead of discarding them
+CAPTURE_BROWSER_BYTES = False #read already loaded images from the browser over CDP instead of downloading again
+CAPTURE_MAX_BYTES = 256 * 1024 * 1024 #cap on captured image bytes held in memory until the download phase
+
+# LOGGING:
+QUEUE_LOGGING = True #log records are handed to a background writer thread instead of written by the caller
+STRUCTURED_LOGS = False #write the log file as JSON lines with run/query ids
+PROGRESS_LOG_INTERVAL = 2.0 #minimum seconds between progress lines
+
+# OUTPUT:
+SHARD_DEPTH = 2 #levels of hashed subdirectories images are spread across
+FSYNC_POLICY = "batch" #"always" fsyncs every image, "batch" fsyncs and renames images every FSYNC_BATCH_SIZE saves, "never" leaves it to the OS
+FSYNC_BATCH_SIZE = 50
+
 THUMBNAIL_SELECTORS = [
     "img.rg_i", #default
     "img.Q4LuWd", #alternative
@@ -11,14 +11,24 @@ from selenium.common.exceptions import (
 from selenium.webdriver.support import expected_conditions as EC
 import requests
 import io
+import base64
+import binascii
+import json
 from PIL import Image
 import time
 import os
 import logging
 import random
+import queue
+import atexit
+import uuid
+import copy
+import hashlib
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
+from urllib.parse import unquote_to_bytes
 
 try:
     from .config import (
@@ -26,6 +36,15 @@ try:
         HEADLESS,
         SELECTOR_VERSION,
         DELAY,
+        CAPTURE_INLINE_IMAGES,
+        CAPTURE_BROWSER_BYTES,
+        CAPTURE_MAX_BYTES,
+        QUEUE_LOGGING,
+        STRUCTURED_LOGS,
+        PROGRESS_LOG_INTERVAL,
+        SHARD_DEPTH,
+        FSYNC_POLICY,
+        FSYNC_BATCH_SIZE,
         THUMBNAIL_SELECTORS,
         FULL_IMAGE_SELECTORS,
         ACCEPT_COOKIES_SELECTORS,
@@ -37,6 +56,15 @@ except ImportError:
     HEADLESS = False
     SELECTOR_VERSION = "2025-10-16"
     DELAY = 1
+    CAPTURE_INLINE_IMAGES = True
+    CAPTURE_BROWSER_BYTES = False
+    CAPTURE_MAX_BYTES = 256 * 1024 * 1024
+    QUEUE_LOGGING = True
+    STRUCTURED_LOGS = False
+    PROGRESS_LOG_INTERVAL = 2.0
+    SHARD_DEPTH = 2
+    FSYNC_POLICY = "batch"
+    FSYNC_BATCH_SIZE = 50
 
     # SELECTORS FOR IMAGE SCRAPING:
 
@@ -72,14 +100,112 @@ except ImportError:
     ]
 
 # LOG SETUP:
-logging.basicConfig( #logger setup in info mode with details about time, lvl and message
-    level=logging.INFO, 
-    format= "%(asctime)s - %(levelname)s - %(message)s",
-    handlers= [#log config
-        logging.FileHandler("image_scraper.log"), #logs to file
-        logging.StreamHandler()#logs to console
-    ]
-)
+class JsonFormatter(logging.Formatter):
+    """
+    Formats log records as one JSON object per line
+    """
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "run_id": getattr(record, "run_id", None),
+            "query": getattr(record, "query", None),
+            "event": getattr(record, "event", None),
+            "message": record.getMessage().strip(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class RunContextFilter(logging.Filter):
+    """
+    Stamps every record with the current run id and query
+    """
+    def __init__(self):
+        super().__init__()
+        self.run_id = None
+        self.query = None
+
+    def filter(self, record):
+        record.run_id = self.run_id
+        record.query = self.query
+        return True
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+    The default prepare() formats the record in the calling thread, which is the cost we want off the workers.
+    A shallow copy is queued so handlers on other loggers never see a record mutated by the listener.
+    """
+    def prepare(self, record):
+        return copy.copy(record)
+
+class ProgressLogger:
+    """
+    Rate limited progress lines, logs at most once per interval plus the final update
+    """
+    def __init__(self, interval:float = PROGRESS_LOG_INTERVAL):
+        self.interval = interval
+        self.last_logged = 0.0
+
+    def update(self, done:int, total:int, message:str, *args, event:str = "progress"):
+        """
+        message and args are passed to log.info lazily, nothing is formatted for skipped updates
+        """
+        now = time.monotonic()
+        if done >= total or now - self.last_logged >= self.interval:
+            self.last_logged = now
+            log.info(message, *args, extra={"event": event})
+
+run_context = RunContextFilter() #holds run/query ids for log records
+log_listener = None #background log writer, set by setup_logging
+
+def setup_logging(queue_logging:bool = QUEUE_LOGGING, structured:bool = STRUCTURED_LOGS):
+    """
+    Sets up file and console logging on the root logger, called by main so importing the package has no side effects.
+    With queue_logging both handlers sit behind a queue and a background writer thread does all formatting and I/O.
+    returns the QueueListener or None if logging synchronously
+    """
+    global log_listener
+    if log_listener is not None: #already set up, e.g. main called twice
+        return log_listener
+
+    text_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    file_handler = logging.FileHandler("image_scraper.log") #logs to file
+    file_handler.setFormatter(JsonFormatter() if structured else text_formatter)
+    stream_handler = logging.StreamHandler() #logs to console
+    stream_handler.setFormatter(text_formatter)
+
+    #handlers added directly, basicConfig would silently do nothing if the root logger is already configured
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+
+    if not queue_logging:
+        for handler in (file_handler, stream_handler):
+            handler.addFilter(run_context)
+            root.addHandler(handler)
+        return None
+
+    #workers only put records on the queue, the listener thread formats and writes them
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(run_context)
+    log_listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop) #writes remaining records on exit
+    root.addHandler(queue_handler)
+    return log_listener
+
+def flush_logs():
+    """
+    Waits for the background writer to write every queued record.
+    Called before input() prompts so log lines don't print after or inside the prompt.
+    """
+    if log_listener is None:
+        return
+    log_listener.stop() #stop() drains the queue and joins the writer thread
+    log_listener.start()
+
 log = logging.getLogger(__name__) #logger instance
 
 def driver_setup(headless:bool = False):
@@ -98,6 +224,10 @@ def driver_setup(headless:bool = False):
     driver_options.add_argument("--disable-dev-shm-usage")
     driver_options.add_argument("--window-size=1920,1080")
 
+    #performance log gives request ids so loaded image bodies can be read over CDP
+    if CAPTURE_BROWSER_BYTES:
+        driver_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
     # Create undetected Chrome instance
     try:
         wd = uc.Chrome(options=driver_options, version_main=None)
@@ -112,16 +242,10 @@ def main(query:str=None, max_images:int=None):
     """
     MAIN FUNCTION:
     """
+    setup_logging()
 
-    #Path setup:
+    #Path setup, the writer creates accepted/ and rejected/<reason>/ as needed:
     download_path : str = "./images/" #path to images folder
-    original_path = os.path.join(download_path, "accepted") #path to accepted images folder
-    rejected_path = os.path.join(download_path, "rejected") #path to rejected images
-
-    #path creation if not exists:
-    for path in [original_path, rejected_path]:
-        if not os.path.exists(path): 
-            os.makedirs(path) 
 
     #get user input for query:
     if query is None:
@@ -129,15 +253,24 @@ def main(query:str=None, max_images:int=None):
     if max_images is None:
         max_images = int(input("How many images would you like to download?: ")) #max images wanted
 
+    #tag this run's log records
+    run_context.run_id = uuid.uuid4().hex[:12]
+    run_context.query = query
+
     #starting logs
+    log.info(f"Run id: {run_context.run_id}")
     log.info(f"Starting image scraper for query: {query} with {max_images} images")
     log.info(f"Selector version: {SELECTOR_VERSION}, if it doesn't work please check for updates")
     log.info("Using undetected-chromedriver to avoid bot detection")
 
+    #hashed, sharded output so reruns never overwrite earlier images
+    writer = OutputWriter(download_path, run_context.run_id)
+
     # Undetected Chrome setup
     driver_options = uc.ChromeOptions()
 
     headless_mode:str = ''
+    flush_logs()
     try:
         while headless_mode not in ['y','n']:
             headless_mode = input("Would you like to run the browser in headless mode? (y/n): ").lower()
@@ -149,11 +282,13 @@ def main(query:str=None, max_images:int=None):
     wd = driver_setup(headless=headless)
     if not wd:
         log.error("Webdriver setup failed, exiting...")
+        writer.close()
         return
 
     try:
         #call get images function and download images from them
-        image_urls = get_images_from_google(webdriver=wd, search_request=query, delay=DELAY, max_images=max_images)
+        captured_images = {} #url -> bytes already loaded by the browser
+        image_urls = get_images_from_google(webdriver=wd, search_request=query, delay=DELAY, max_images=max_images, captured=captured_images)
 
         #No images found, saves page source if in debug mode
         if not image_urls:
@@ -180,15 +315,15 @@ def main(query:str=None, max_images:int=None):
             for i, url in enumerate(image_urls_list):
                 future = executor.submit( #submit download task to the worker thread
                     download_image,
-                    original_path=original_path,
-                    rejected_path=rejected_path,
                     url=url,
-                    file_name=f"{query}_{i+1}.jpg"
+                    content=captured_images.pop(url, None),
+                    writer=writer
                 )
                 future_to_url[future] = (i,url) #map future to index and url as a tuple
 
                 #update stats as futures complete individually
             completed = 0 
+            progress = ProgressLogger()
             for future in as_completed(future_to_url):
                 completed += 1
                 try:
@@ -198,8 +333,8 @@ def main(query:str=None, max_images:int=None):
                     with stats_lock:
                         download_stats[result] += 1
 
-                    #Progress log:
-                    log.info(f"Progress: {completed}/{len(image_urls_list)} images downloaded")
+                    #Progress log, rate limited:
+                    progress.update(completed, len(image_urls_list), "Progress: %d/%d images downloaded", completed, len(image_urls_list))
                 except Exception as e:
                     log.error(f"Image download failed - Error in downloading image: {e}")
                     with stats_lock:
@@ -220,8 +355,10 @@ def main(query:str=None, max_images:int=None):
             save_page_source(wd, "error")
     finally:
         if DEBUG_MODE:
+            flush_logs()
             input("\nPress enter to close browser window")
         wd.quit() #ensures webdriver instance is quit even if error occurs
+        writer.close()
         log.info("Download complete, please check for downloaded images in 'images' folder")
     
 def save_cookies(webdriver, filename:str = "google_cookies.pkl"):
@@ -310,7 +447,7 @@ def find_elements(webdriver, selectors:list, element_type:str="elements"):
         try:
             elements = webdriver.find_elements(By.CSS_SELECTOR, selector)
             if elements:
-                log.info(f"Found {len(elements)} {element_type} using selector: {selector}")
+                log.debug("Found %d %s using selector: %s", len(elements), element_type, selector)
                 return elements, selector
         except Exception as e:
             log.debug(f"Selector {selector} failed: {e}")
@@ -341,9 +478,11 @@ def thumbnails_fallback(webdriver):
     return thumbnails
 
 
-def get_images_from_google(webdriver, search_request:str, delay:int, max_images:int, max_allowed_failures:int = 20):
+def get_images_from_google(webdriver, search_request:str, delay:int, max_images:int, max_allowed_failures:int = 20, captured:dict = None):
     """
     Gets images from google search with improved stale element handling
+    If a captured dict is passed it is filled with url -> bytes for images already loaded in the browser,
+    up to CAPTURE_MAX_BYTES in total, anything past that is downloaded normally
     """
     def scroll_down(wd):
         """
@@ -400,6 +539,9 @@ def get_images_from_google(webdriver, search_request:str, delay:int, max_images:
     consecutive_failures = 0
     max_failures = max_allowed_failures
     last_thumbnail_count = 0  # Track if we're making progress
+    request_ids = {} # url -> CDP request id, performance log entries are only read once
+    captured_bytes = 0 #total size of captured content, kept under CAPTURE_MAX_BYTES
+    progress = ProgressLogger()
     
 
     #loop for image finding:
@@ -511,31 +653,49 @@ def get_images_from_google(webdriver, search_request:str, delay:int, max_images:
                 successful_fullsize_selector = f_selector
                 log.info(f"Using full image selector: {f_selector}")
 
+            http_src = None
+            inline_src = None #first inline candidate, only used if no element has an http src
             for img in full_images:
                 try:
                     # Wait for src attribute to be available
                     src = None
                     for attempt in range(3):
                         src = img.get_attribute("src")
-                        if src and "http" in src:
+                        if src and src.startswith("http"):
                             break
                         time.sleep(0.3)  # Wait between attempts
-                    
-                    if not src or "http" not in src:
+
+                    if not src:
                         continue
-                    
-                    if src in image_urls:
-                        skips += 1
+
+                    if src.startswith("http"):
+                        http_src = src
                         break
-                    
-                    image_urls.add(src)
-                    log.info(f"Found {len(image_urls)}/{max_images}")
-                    break
-                    
+
+                    #inline images are often the low res placeholder, keep scanning for an http src
+                    if inline_src is None and CAPTURE_INLINE_IMAGES and src[:10].lower() == "data:image":
+                        inline_src = src
+
                 except Exception as e:
                     log.debug(f"Error getting src: {e}")
                     continue
-            
+
+            src = http_src or inline_src
+            if src and src in image_urls:
+                skips += 1
+            elif src:
+                image_urls.add(src)
+
+                #pull bytes the browser already loaded so the image isn't fetched twice
+                if captured is not None and CAPTURE_BROWSER_BYTES and http_src and captured_bytes < CAPTURE_MAX_BYTES:
+                    content = fetch_loaded_image(webdriver, src, request_ids)
+                    if content and captured_bytes + len(content) <= CAPTURE_MAX_BYTES:
+                        captured[src] = content
+                        captured_bytes += len(content)
+
+                log.debug("Found image: %s", describe_source(src), extra={"event": "image_found"})
+                progress.update(len(image_urls), max_images, "Found %d/%d", len(image_urls), max_images)
+
             processed_count += 1
 
         #Safety checks:
@@ -570,6 +730,89 @@ def get_images_from_google(webdriver, search_request:str, delay:int, max_images:
 
     return image_urls
 
+def describe_source(url:str):
+    """
+    Short version of an image source for logs, data: URIs can be huge
+    """
+    if url.startswith("data:"):
+        return url.split(",", 1)[0] + ",..."
+    return url
+
+def source_id(url:str):
+    """
+    Stable identifier for an image source, data: URIs are replaced by their mime type and a hash of the URI
+    """
+    if url.startswith("data:"):
+        mime = url[5:].split(",", 1)[0].split(";", 1)[0]
+        return f"data:{mime};sha256={hashlib.sha256(url.encode()).hexdigest()}"
+    return url
+
+def decode_data_uri(uri:str):
+    """
+    Decodes a data: URI into raw bytes.
+    returns None if the uri isn't a usable image data uri
+    """
+    try:
+        header, data = uri.split(",", 1)
+    except ValueError:
+        log.debug("Malformed data uri, no ',' separator")
+        return None
+
+    header = header.lower() #RFC 2397 media type and ;base64 are case insensitive
+    if not header.startswith("data:image"):
+        return None
+
+    try:
+        if header.endswith(";base64"):
+            content = base64.b64decode(data, validate=True)
+        else:
+            content = unquote_to_bytes(data) #non base64 data uris are percent encoded
+    except (binascii.Error, ValueError) as e:
+        log.debug(f"Failed to decode data uri: {e}")
+        return None
+
+    return content or None
+
+def fetch_loaded_image(webdriver, src:str, request_ids:dict = None, max_tracked:int = 500):
+    """
+    Gets bytes of an image the browser has already loaded over CDP, avoiding a second download.
+    Needs performance logging, image request ids are read from it and kept in request_ids between calls.
+    returns bytes or None if the browser can't hand them over
+    """
+    if request_ids is None:
+        request_ids = {}
+
+    #look up image responses in the performance log, the log is drained on every read
+    try:
+        for entry in webdriver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") == "Network.responseReceived":
+                params = message["params"]
+                if params["response"].get("mimeType", "").startswith("image/"):
+                    request_ids[params["response"]["url"]] = params["requestId"]
+    except Exception as e:
+        log.debug(f"Performance log unavailable: {e}")
+
+    #only the most recent responses are kept, older ones are long gone from the thumbnail panel
+    while len(request_ids) > max_tracked:
+        del request_ids[next(iter(request_ids))]
+
+    request_id = request_ids.pop(src, None)
+    if not request_id:
+        return None
+
+    try:
+        body = webdriver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        if body.get("base64Encoded"):
+            content = base64.b64decode(body["body"])
+        else:
+            content = body["body"].encode("latin-1")
+        log.debug(f"Got image bytes from CDP response body: {src}")
+        return content
+    except Exception as e:
+        log.debug(f"CDP response body unavailable for {src}: {e}")
+        return None
+
 def valid_image(image):
     """
     Validates image by checking file format and dimensions.
@@ -590,51 +833,190 @@ def valid_image(image):
     return True, "valid"
 
 
-def download_image(original_path:str, rejected_path:str, url:str, file_name:str):
+class OutputWriter:
     """
-    Downloads image from urls and saves to relevant path
-    returns 'success', 'failed' or 'rejected' based on outcome
+    Saves images under content hash filenames in sharded subdirectories, e.g. accepted/ab/cd/abcd....jpg
+    Files are written to a temp file then renamed so a crash never leaves a half written image under its final name.
+    Every save is recorded in a per-run index file mapping url -> path.
+
+    fsync policies:
+    "always" fsyncs each file before its rename, then its directory and the index
+    "batch" leaves temp files in place and every fsync_batch_size saves fsyncs them, renames them and fsyncs their directories and the index,
+    so saved paths only appear at the batch boundary or on close()
+    "never" renames straight away and leaves syncing to the OS
     """
+    def __init__(self, base_path:str, run_id:str, shard_depth:int = SHARD_DEPTH, fsync_policy:str = FSYNC_POLICY, fsync_batch_size:int = FSYNC_BATCH_SIZE):
+        if fsync_policy not in ("always", "batch", "never"):
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+
+        self.base_path = base_path
+        self.shard_depth = shard_depth
+        self.fsync_policy = fsync_policy
+        self.fsync_batch_size = fsync_batch_size
+        self._created_dirs = set() #directories known to exist, skips makedirs on every save
+        self._pending = [] #(temp path, final path) waiting for the next batch sync
+        self._lock = Lock()
+
+        #per-run index, timestamped so reruns never overwrite an earlier one
+        index_dir = os.path.join(base_path, "index")
+        self._ensure_dir(index_dir)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.index_path = os.path.join(index_dir, f"{timestamp}_{run_id}.jsonl")
+        self._index = open(self.index_path, "a", encoding="utf-8")
+
+    def _ensure_dir(self, path:str):
+        if path in self._created_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        with self._lock:
+            self._created_dirs.add(path)
 
+    def save(self, image, url:str, category:str, quality:int = 95):
+        """
+        Encodes image as JPEG and writes it under category (e.g. 'accepted' or 'rejected/too_small')
+        returns the file path
+        """
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=quality)
+        data = buffer.getvalue()
+
+        #content hash name and shard directories from its leading characters
+        digest = hashlib.sha256(data).hexdigest()
+        shards = [digest[2*i:2*i+2] for i in range(self.shard_depth)]
+        directory = os.path.join(self.base_path, category, *shards)
+        file_path = os.path.join(directory, f"{digest}.jpg")
+        self._ensure_dir(directory)
+
+        #no existence check, the name comes from the content so replacing an existing file changes nothing
+        temp_path = os.path.join(directory, f".{digest}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+                if self.fsync_policy == "always":
+                    f.flush()
+                    os.fsync(f.fileno())
+            if self.fsync_policy != "batch":
+                os.replace(temp_path, file_path) #atomic rename on the same filesystem
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        entry = {"url": source_id(url), "path": file_path, "category": category}
+        with self._lock:
+            self._index.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if self.fsync_policy == "always":
+                _fsync_path(directory)
+                self._sync_index()
+            elif self.fsync_policy == "batch":
+                self._pending.append((temp_path, file_path))
+                if len(self._pending) >= self.fsync_batch_size:
+                    self._sync_pending()
+
+        return file_path
+
+    def _sync_pending(self):
+        """
+        fsyncs pending temp files, renames them into place, then fsyncs their directories and the index.
+        Caller holds the lock.
+        """
+        directories = set()
+        for temp_path, file_path in self._pending:
+            try:
+                _fsync_path(temp_path)
+                os.replace(temp_path, file_path)
+                directories.add(os.path.dirname(file_path))
+            except OSError as e:
+                log.error(f"Failed to move {temp_path} into place: {e}")
+        self._pending.clear()
+
+        for directory in directories:
+            _fsync_path(directory)
+        self._sync_index()
+
+    def _sync_index(self):
+        self._index.flush()
+        os.fsync(self._index.fileno())
+
+    def close(self):
+        """
+        Finishes any pending batch and closes the index file
+        """
+        with self._lock:
+            if self._index.closed:
+                return
+            if self.fsync_policy == "batch":
+                self._sync_pending()
+            self._index.close()
+        log.info(f"Output index written to {self.index_path}")
+
+def _fsync_path(path:str):
+    """
+    fsyncs a file or directory by path, directories can't be opened on some platforms so failures are ignored
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
     try:
-        #image content download
-        response = requests.get(url, timeout=10)
-        response.raise_for_status() #raises error for bad status codes
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def download_image(url:str, writer:OutputWriter, content:bytes = None):
+    """
+    Downloads image from urls and saves it through the writer under accepted or rejected/<reason>
+    data: URIs and already captured content skip the network request
+    returns 'success', 'failed' or 'rejected' based on outcome
+    """
+    source = describe_source(url)
 
-        #Gets image content, converts to a binary stream and opens with PIL
-        image_content = response.content
-        image_file = io.BytesIO(image_content)
-        image = Image.open(image_file).convert("RGB")
+    try:
+        #bytes captured from the browser, falls back to downloading if they aren't a usable image
+        image = None
+        if content is not None:
+            try:
+                image = Image.open(io.BytesIO(content)).convert("RGB")
+            except Exception as e:
+                log.debug("Captured bytes for %s unusable, downloading instead: %s", source, e)
+
+        if image is None:
+            #image content download
+            if url[:5].lower() == "data:":
+                image_content = decode_data_uri(url)
+                if image_content is None:
+                    log.error("Failed to decode inline image: %s", source, extra={"event": "image_failed"})
+                    return "failed"
+            else:
+                response = requests.get(url, timeout=10)
+                response.raise_for_status() #raises error for bad status codes
+                image_content = response.content
+
+            #converts content to a binary stream and opens with PIL
+            image_file = io.BytesIO(image_content)
+            image = Image.open(image_file).convert("RGB")
 
         #image quality validation:
         validity, reason = valid_image(image)
 
         #path set up based on rejection reason:
         if not validity:
-            reject_path = os.path.join(rejected_path, reason)
-            if not os.path.exists(reject_path):
-                os.makedirs(reject_path)
-            #file path for rejected image of that reason, save image in path as jpeg
-            file_path = os.path.join(reject_path, file_name)
-            with open(file_path, "wb") as f:
-                image.save(f, "JPEG", quality=85)
-            
-            #log and rejection returned
-            log.info(f"Image rejected due to {reason}: {file_name}")
+            #rejected image saved under its rejection reason
+            file_path = writer.save(image, url, os.path.join("rejected", reason), quality=85)
+            log.debug("Image rejected due to %s: %s", reason, file_path, extra={"event": "image_rejected"})
             return "rejected"
-        
-        #accepted image handling:
-        file_path = os.path.join(original_path, file_name)
-        with open(file_path,"wb") as f:
-            image.save(f, "JPEG", quality=95)
 
-        log.info(f"✓ Downloaded: {file_name} ({image.size[0]}x{image.size[1]})")
+        #accepted image handling:
+        file_path = writer.save(image, url, "accepted", quality=95)
+        log.debug("✓ Downloaded: %s (%dx%d)", file_path, image.size[0], image.size[1], extra={"event": "image_saved"})
         return "success"
     except requests.exceptions.RequestException as e:
-        log.error(f"Failed to download image from {url}: {e}")
+        log.error("Failed to download image from %s: %s", source, e, extra={"event": "image_failed"})
         return "failed"
     except Exception as e:
-        log.error(f"Error processing image from {url}: {e}")
+        log.error("Error processing image from %s: %s", source, e, extra={"event": "image_failed"})
         return "failed"
 
 def save_page_source(webdriver, prefix:str = "debug"):
@@ -652,5 +1034,6 @@ def save_page_source(webdriver, prefix:str = "debug"):
 
 if __name__ == "__main__":
     main()
+    flush_logs()
     input("\nPress enter key to exit")
     #End of script
\ No newline at end of file